@@ -1,6 +1,7 @@
 """Support for media players through the SmartThings cloud API."""
 from __future__ import annotations
 
+import sys
 from collections.abc import Sequence
 from typing import Any
 
@@ -21,18 +22,48 @@ from . import SmartThingsConfigEntry
 from .const import MAIN
 from .entity import SmartThingsEntity
 
-CONTROLLABLE_SOURCES = ["bluetooth", "wifi"]
+CONTROLLABLE_SOURCES = frozenset({"bluetooth", "wifi"})
 
+_INV_100 = 0.01
+
+_ACTIVE_STATES = (MediaPlayerState.PLAYING, MediaPlayerState.PAUSED)
+
+_BASE_FEATURES = (
+    MediaPlayerEntityFeature.PLAY
+    | MediaPlayerEntityFeature.PAUSE
+    | MediaPlayerEntityFeature.STOP
+)
+
+_CAPABILITY_FEATURES: tuple[tuple[Capability, MediaPlayerEntityFeature], ...] = (
+    (
+        Capability.audio_volume,
+        MediaPlayerEntityFeature.VOLUME_SET | MediaPlayerEntityFeature.VOLUME_STEP,
+    ),
+    (Capability.audio_mute, MediaPlayerEntityFeature.VOLUME_MUTE),
+    (
+        Capability.switch,
+        MediaPlayerEntityFeature.TURN_ON | MediaPlayerEntityFeature.TURN_OFF,
+    ),
+    (Capability.media_input_source, MediaPlayerEntityFeature.SELECT_SOURCE),
+    (Capability.media_playback_shuffle, MediaPlayerEntityFeature.SHUFFLE_SET),
+    (Capability.media_playback_repeat, MediaPlayerEntityFeature.REPEAT_SET),
+)
+
+# Keys are interned so lookups on incoming status strings can hit the
+# pointer-equality fast path.
 VALUE_TO_STATE = {
-    "buffering": MediaPlayerState.BUFFERING,
-    "pause": MediaPlayerState.PAUSED,
-    "paused": MediaPlayerState.PAUSED,
-    "play": MediaPlayerState.PLAYING,
-    "playing": MediaPlayerState.PLAYING,
-    "stop": MediaPlayerState.IDLE,
-    "stopped": MediaPlayerState.IDLE,
-    "on": MediaPlayerState.ON,
-    "off": MediaPlayerState.OFF,
+    sys.intern(key): state
+    for key, state in {
+        "buffering": MediaPlayerState.BUFFERING,
+        "pause": MediaPlayerState.PAUSED,
+        "paused": MediaPlayerState.PAUSED,
+        "play": MediaPlayerState.PLAYING,
+        "playing": MediaPlayerState.PLAYING,
+        "stop": MediaPlayerState.IDLE,
+        "stopped": MediaPlayerState.IDLE,
+        "on": MediaPlayerState.ON,
+        "off": MediaPlayerState.OFF,
+    }.items()
 }
 
 
@@ -47,39 +78,79 @@ async def async_setup_entry(
         [
             SmartThingsMediaPlayer(entry_data.client, entry_data.rooms, device)
             for device in entry_data.devices.values()
-            if any(
-                capability in device.status[MAIN]
-                for capability in get_capabilities(device.status[MAIN])
-            )
+            if get_capabilities(device.status[MAIN]) is not None
         ]
     )
 
 
-def get_capabilities(capabilities: Sequence[str]) -> Sequence[str] | None:
-    """Return all capabilities supported if minimum required are present."""
-    supported = [
-        Capability.audio_mute,
-        Capability.audio_volume,
-        Capability.media_input_source,
-        Capability.media_playback,
-        Capability.media_playback_repeat,
-        Capability.media_playback_shuffle,
-        Capability.switch,
-    ]
-    # Must have one of these.
-    media_player_capabilities = [
+_SUPPORTED_CAPS = (
+    Capability.audio_mute,
+    Capability.audio_volume,
+    Capability.media_input_source,
+    Capability.media_playback,
+    Capability.media_playback_repeat,
+    Capability.media_playback_shuffle,
+    Capability.switch,
+)
+
+_MEDIA_PLAYER_CAPABILITIES = frozenset(_SUPPORTED_CAPS)
+# Must have one of these.
+_REQUIRED_ANY_CAPS = frozenset(
+    {
         Capability.audio_mute,
         Capability.audio_volume,
         Capability.media_input_source,
         Capability.media_playback,
         Capability.media_playback_repeat,
         Capability.media_playback_shuffle,
-    ]
-    if any(capability in capabilities for capability in media_player_capabilities):
-        return supported
+    }
+)
+
+
+def get_capabilities(capabilities: Sequence[str]) -> Sequence[str] | None:
+    """Return all capabilities supported if minimum required are present."""
+    if not _REQUIRED_ANY_CAPS.isdisjoint(capabilities):
+        return _SUPPORTED_CAPS
     return None
 
 
+# Command methods with no service argument, generated onto the entity class
+# below from one shared factory.
+_COMMAND_METHODS: tuple[tuple[str, str, Capability, Command], ...] = (
+    ("async_turn_off", "Turn the media player off.", Capability.switch, Command.OFF),
+    ("async_turn_on", "Turn the media player on.", Capability.switch, Command.ON),
+    (
+        "async_volume_up",
+        "Increase volume.",
+        Capability.audio_volume,
+        Command.VOLUME_UP,
+    ),
+    (
+        "async_volume_down",
+        "Decrease volume.",
+        Capability.audio_volume,
+        Command.VOLUME_DOWN,
+    ),
+    ("async_media_play", "Play media.", Capability.media_playback, Command.PLAY),
+    ("async_media_pause", "Pause media.", Capability.media_playback, Command.PAUSE),
+    ("async_media_stop", "Stop media.", Capability.media_playback, Command.STOP),
+)
+
+
+def _make_command_method(
+    name: str, doc: str, capability: Capability, command: Command
+):
+    """Build an entity method that executes a fixed device command."""
+
+    async def _async_command(self, **kwargs: Any) -> None:
+        await self.execute_device_command(capability, command)
+
+    _async_command.__name__ = name
+    _async_command.__qualname__ = f"SmartThingsMediaPlayer.{name}"
+    _async_command.__doc__ = doc
+    return _async_command
+
+
 class SmartThingsMediaPlayer(SmartThingsEntity, MediaPlayerEntity):
     """Define a SmartThings media player."""
 
@@ -87,55 +158,20 @@ class SmartThingsMediaPlayer(SmartThingsEntity, MediaPlayerEntity):
 
     def __init__(self, client, rooms: dict[str, str], device) -> None:
         """Initialize the media_player class."""
-        super().__init__(
-            client,
-            device,
-            rooms,
-            {
-                Capability.audio_mute,
-                Capability.audio_volume,
-                Capability.media_input_source,
-                Capability.media_playback,
-                Capability.media_playback_repeat,
-                Capability.media_playback_shuffle,
-                Capability.switch,
-            },
-        )
-        self._attr_supported_features = self._determine_features()
-
-    def _determine_features(self) -> MediaPlayerEntityFeature:
-        """Determine supported features based on capabilities."""
-        features = (
-            MediaPlayerEntityFeature.PLAY
-            | MediaPlayerEntityFeature.PAUSE
-            | MediaPlayerEntityFeature.STOP
+        super().__init__(client, device, rooms, _MEDIA_PLAYER_CAPABILITIES)
+        features = _BASE_FEATURES
+        device_capabilities = device.status[MAIN]
+        for capability, feature_bits in _CAPABILITY_FEATURES:
+            if capability in device_capabilities:
+                features |= feature_bits
+        self._attr_supported_features = features
+        self._has_volume_set = bool(features & MediaPlayerEntityFeature.VOLUME_SET)
+        self._has_volume_mute = bool(features & MediaPlayerEntityFeature.VOLUME_MUTE)
+        self._has_select_source = bool(
+            features & MediaPlayerEntityFeature.SELECT_SOURCE
         )
-        if self.supports_capability(Capability.audio_volume):
-            features |= (
-                MediaPlayerEntityFeature.VOLUME_SET
-                | MediaPlayerEntityFeature.VOLUME_STEP
-            )
-        if self.supports_capability(Capability.audio_mute):
-            features |= MediaPlayerEntityFeature.VOLUME_MUTE
-        if self.supports_capability(Capability.switch):
-            features |= (
-                MediaPlayerEntityFeature.TURN_ON | MediaPlayerEntityFeature.TURN_OFF
-            )
-        if self.supports_capability(Capability.media_input_source):
-            features |= MediaPlayerEntityFeature.SELECT_SOURCE
-        if self.supports_capability(Capability.media_playback_shuffle):
-            features |= MediaPlayerEntityFeature.SHUFFLE_SET
-        if self.supports_capability(Capability.media_playback_repeat):
-            features |= MediaPlayerEntityFeature.REPEAT_SET
-        return features
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn the media player off."""
-        await self.execute_device_command(Capability.switch, Command.OFF)
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn the media player on."""
-        await self.execute_device_command(Capability.switch, Command.ON)
+        self._has_shuffle_set = bool(features & MediaPlayerEntityFeature.SHUFFLE_SET)
+        self._has_repeat_set = bool(features & MediaPlayerEntityFeature.REPEAT_SET)
 
     async def async_mute_volume(self, mute: bool) -> None:
         """Mute volume."""
@@ -152,26 +188,6 @@ class SmartThingsMediaPlayer(SmartThingsEntity, MediaPlayerEntity):
             argument=int(volume * 100),
         )
 
-    async def async_volume_up(self) -> None:
-        """Increase volume."""
-        await self.execute_device_command(Capability.audio_volume, Command.VOLUME_UP)
-
-    async def async_volume_down(self) -> None:
-        """Decrease volume."""
-        await self.execute_device_command(Capability.audio_volume, Command.VOLUME_DOWN)
-
-    async def async_media_play(self) -> None:
-        """Play media."""
-        await self.execute_device_command(Capability.media_playback, Command.PLAY)
-
-    async def async_media_pause(self) -> None:
-        """Pause media."""
-        await self.execute_device_command(Capability.media_playback, Command.PAUSE)
-
-    async def async_media_stop(self) -> None:
-        """Stop media."""
-        await self.execute_device_command(Capability.media_playback, Command.STOP)
-
     async def async_select_source(self, source: str) -> None:
         """Select source."""
         await self.execute_device_command(
@@ -204,44 +220,54 @@ class SmartThingsMediaPlayer(SmartThingsEntity, MediaPlayerEntity):
     @property
     def media_title(self):
         """Return the media title if available."""
-        if (self.state in [MediaPlayerState.PLAYING, MediaPlayerState.PAUSED] and
-            'trackDescription' in self._device.status.attributes):
-            return self._device.status.attributes['trackDescription'].value
-        return None
+        if self.state not in _ACTIVE_STATES:
+            return None
+        attributes = self.device.status[MAIN].get("musicPlayer")
+        if attributes is None:
+            return None
+        track = attributes.get("trackDescription")
+        return track.value if track is not None else None
 
     @property
     def state(self) -> MediaPlayerState | None:
         """Get the current state of the media player."""
-        if self.get_attribute_value(Capability.switch, Attribute.SWITCH):
-            if self.source is not None and self.source in CONTROLLABLE_SOURCES:
+        if not self.get_attribute_value(Capability.switch, Attribute.SWITCH):
+            return MediaPlayerState.OFF
+        if self._has_select_source:
+            source = self.get_attribute_value(
+                Capability.media_input_source, Attribute.INPUT_SOURCE
+            )
+            if source in CONTROLLABLE_SOURCES:
                 playback_status = self.get_attribute_value(
                     Capability.media_playback, Attribute.PLAYBACK_STATUS
                 )
-                if playback_status in VALUE_TO_STATE:
-                    return VALUE_TO_STATE[playback_status]
-            return MediaPlayerState.ON
-        return MediaPlayerState.OFF
+                if type(playback_status) is str:
+                    playback_status = sys.intern(playback_status)
+                mapped = VALUE_TO_STATE.get(playback_status)
+                if mapped is not None:
+                    return mapped
+        return MediaPlayerState.ON
 
     @property
     def is_volume_muted(self) -> bool | None:
         """Return if the media player is muted."""
-        if self.supported_features & MediaPlayerEntityFeature.VOLUME_MUTE:
+        if self._has_volume_mute:
             return self.get_attribute_value(Capability.audio_mute, Attribute.MUTE)
         return None
 
     @property
     def volume_level(self) -> float | None:
         """Return the volume level."""
-        if self.supported_features & MediaPlayerEntityFeature.VOLUME_SET:
+        if self._has_volume_set:
             volume = self.get_attribute_value(Capability.audio_volume, Attribute.VOLUME)
             if volume is not None:
-                return float(volume) / 100
+                return volume * _INV_100
         return None
 
     @property
     def source(self) -> str | None:
         """Return the current input source."""
-        if self.supported_features & MediaPlayerEntityFeature.SELECT_SOURCE:
+        if self._has_select_source:
             return self.get_attribute_value(
                 Capability.media_input_source, Attribute.INPUT_SOURCE
             )
@@ -250,7 +276,7 @@ class SmartThingsMediaPlayer(SmartThingsEntity, MediaPlayerEntity):
     @property
     def source_list(self) -> list[str] | None:
         """Return a list of available input sources."""
-        if self.supported_features & MediaPlayerEntityFeature.SELECT_SOURCE:
+        if self._has_select_source:
             return self.get_attribute_value(
                 Capability.media_input_source, Attribute.SUPPORTED_INPUT_SOURCES
             )
@@ -259,7 +285,7 @@ class SmartThingsMediaPlayer(SmartThingsEntity, MediaPlayerEntity):
     @property
     def shuffle(self) -> bool | None:
         """Return True if shuffle is enabled."""
-        if self.supported_features & MediaPlayerEntityFeature.SHUFFLE_SET:
+        if self._has_shuffle_set:
             return self.get_attribute_value(
                 Capability.media_playback_shuffle, Attribute.PLAYBACK_SHUFFLE
             )
@@ -268,8 +294,17 @@ class SmartThingsMediaPlayer(SmartThingsEntity, MediaPlayerEntity):
     @property
     def repeat(self) -> RepeatMode | None:
         """Return current repeat mode."""
-        if self.supported_features & MediaPlayerEntityFeature.REPEAT_SET:
+        if self._has_repeat_set:
             return self.get_attribute_value(
                 Capability.media_playback_repeat, Attribute.PLAYBACK_REPEAT_MODE
             )
         return None
+
+
+for _name, _doc, _capability, _command in _COMMAND_METHODS:
+    setattr(
+        SmartThingsMediaPlayer,
+        _name,
+        _make_command_method(_name, _doc, _capability, _command),
+    )
+del _name, _doc, _capability, _command